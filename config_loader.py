@@ -0,0 +1,113 @@
+"""Shared YAML configuration loading for ``sophia.py`` and ``validate.py``.
+
+A configuration file is read from the first of these that is still current:
+
+1. the frozen ``<name>_data.py`` module written by ``tools/freeze_config.py``;
+2. the pickle cache ``<name>.yaml.pkl`` written on a previous load;
+3. the YAML file itself, which then refreshes the pickle cache.
+
+Both caches record the mtime and size of the YAML they were built from and
+are ignored as soon as the YAML changes.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Dict
+
+
+def frozen_module_path(path: Path) -> Path:
+    """Return the path of the frozen module generated for a YAML file."""
+    return path.with_name(f"{path.stem}_data.py")
+
+
+def parse_yaml(path: Path, label: str) -> Any:
+    """Parse a YAML file, preferring the libyaml-backed loader when available."""
+    # PyYAML is only imported when neither cache can be used.
+    try:
+        import yaml
+    except ModuleNotFoundError as exc:
+        raise RuntimeError(f"PyYAML is required to load the {label} configuration.") from exc
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with path.open("r", encoding="utf-8") as config_file:
+        return yaml.load(config_file, Loader=loader) or {}
+
+
+def _load_frozen_config(path: Path, source_stat: os.stat_result) -> Any:
+    """Return CONFIG from the frozen module if it matches the YAML source, else None."""
+    frozen_path = frozen_module_path(path)
+    spec = importlib.util.spec_from_file_location(frozen_path.stem, frozen_path)
+    if spec is None or spec.loader is None:
+        return None
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        # No frozen module was generated (or it is broken); use the YAML instead.
+        return None
+
+    frozen_stat = (getattr(module, "SOURCE_MTIME_NS", None), getattr(module, "SOURCE_SIZE", None))
+    if frozen_stat != (source_stat.st_mtime_ns, source_stat.st_size):
+        return None
+    return getattr(module, "CONFIG", None)
+
+
+def _read_config_cache(cache_path: Path, source_stat: os.stat_result) -> Any:
+    """Return the cached configuration if it matches the YAML source, else None."""
+    try:
+        with cache_path.open("rb") as cache_file:
+            mtime_ns, size, cached_config = pickle.load(cache_file)
+    except Exception:
+        # A missing, unreadable or corrupt cache just means re-parsing the YAML.
+        return None
+
+    if (mtime_ns, size) != (source_stat.st_mtime_ns, source_stat.st_size):
+        return None
+    return cached_config
+
+
+def _write_config_cache(cache_path: Path, source_stat: os.stat_result, config: Any) -> None:
+    """Atomically store the parsed configuration next to its YAML source."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp_path.open("wb") as cache_file:
+            pickle.dump(
+                (source_stat.st_mtime_ns, source_stat.st_size, config),
+                cache_file,
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # The cache is an optimisation only; a read-only checkout still works.
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def load_config(path: Path, label: str) -> Dict[str, Any]:
+    """Load a YAML configuration mapping; ``label`` names it in error messages."""
+    try:
+        source_stat = path.stat()
+    except FileNotFoundError as exc:
+        raise RuntimeError(f"Configuration file not found at {path}") from exc
+
+    cache_path = path.with_name(f"{path.name}.pkl")
+    raw_config = _load_frozen_config(path, source_stat)
+    if raw_config is None:
+        raw_config = _read_config_cache(cache_path, source_stat)
+    if raw_config is None:
+        try:
+            raw_config = parse_yaml(path, label)
+        except FileNotFoundError as exc:
+            raise RuntimeError(f"Configuration file not found at {path}") from exc
+        _write_config_cache(cache_path, source_stat, raw_config)
+
+    if not isinstance(raw_config, dict):
+        raise RuntimeError(f"{label[:1].upper()}{label[1:]} configuration must be a mapping")
+
+    return raw_config
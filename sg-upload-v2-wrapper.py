@@ -1,33 +1,161 @@
+import os
+import contextlib
 import ssl
 import sys
+import json
 import hashlib
+import mmap
+import shutil
 import subprocess
+import time
+import http.client
+import urllib.error
+import urllib.parse
 import urllib.request
 
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
 REMOTE_URL = "https://ddm.sophiagenetics.com/direct/sg/uploaderv2"
 UPLOADER_FILENAME = "sg-upload-v2-latest.jar"
 UPLOAD_CHECKSUM_FILENAME = "sg-upload-v2-latest.jar.md5"
+LOCAL_CHECKSUM_FILENAME = "sg-upload-v2-latest.jar.local-md5"
+LAST_CHECKED_FILENAME = "sg-upload-v2-latest.jar.last-checked"  # kept next to the JAR it describes
+UPDATE_LOCK_FILENAME = "sg-upload-v2-latest.jar.lock"
 VERSION = "1.0.3"
+DOWNLOAD_CHUNK_SIZE = 1 << 20  # stream the JAR to disk in 1 MiB pieces
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "sg-upload")
+CHECKSUM_HEADERS_FILENAME = os.path.join(CACHE_DIR, "checksum.headers")
+DEFAULT_UPDATE_INTERVAL = 6 * 3600  # seconds between update checks, overridable via SG_UPDATE_INTERVAL
+
+# Verify the server certificate. certifi ships the current Sectigo roots, see
+# https://support.sectigo.com/articles/Knowledge/Sectigo-AddTrust-External-CA-Root-Expiring-May-30-2020
+try:
+    import certifi
+except ImportError:
+    SSL_CONTEXT = ssl.create_default_context()
+else:
+    SSL_CONTEXT = ssl.create_default_context(cafile=certifi.where())
+
+# Keep-alive connection shared by the checksum probe and the JAR download.
+_CONNECTION = None
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+
+def _request_on_shared_connection(host, path, headers):
+    """Send a GET on the shared connection, reconnecting once if the server dropped it."""
+    global _CONNECTION
+    for attempt in range(2):
+        if _CONNECTION is None:
+            _CONNECTION = http.client.HTTPSConnection(host, context=SSL_CONTEXT)
+        try:
+            _CONNECTION.request("GET", path, headers=headers)
+            return _CONNECTION.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            close_connection()
+            if attempt:
+                raise
+        except Exception:
+            close_connection()  # never leave a half-used connection behind
+            raise
+
+
+def close_connection():
+    """Close the shared connection, if one is open."""
+    global _CONNECTION
+    if _CONNECTION is not None:
+        _CONNECTION.close()
+        _CONNECTION = None
+
+
+def open_url(url, headers=None):
+    """Open url, reusing one keep-alive HTTPS connection for requests to REMOTE_URL.
+
+    Behaves like urllib.request.urlopen: error statuses (including 304) raise
+    HTTPError. Proxied access, other hosts and redirects go through urllib.
+    """
+    headers = dict(headers or {})
+    headers.setdefault("User-Agent", f"Python-urllib/{sys.version_info[0]}.{sys.version_info[1]}")
+    parts = urllib.parse.urlsplit(url)
+    remote_host = urllib.parse.urlsplit(REMOTE_URL).netloc
+    if (parts.scheme != "https" or parts.netloc != remote_host
+            or (urllib.request.getproxies().get("https") and not urllib.request.proxy_bypass(parts.hostname))):
+        return urllib.request.urlopen(urllib.request.Request(url, headers=headers), context=SSL_CONTEXT)
+
+    path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+    response = _request_on_shared_connection(parts.netloc, path or "/", headers)
+    if response.status in _REDIRECT_CODES and response.headers.get("Location"):
+        response.read()
+        location = urllib.parse.urljoin(url, response.headers["Location"])
+        return urllib.request.urlopen(urllib.request.Request(location, headers=headers), context=SSL_CONTEXT)
+    if response.status >= 300:
+        response.read()  # drain the body so the connection can be reused
+        raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+    return response
+
+
+def load_checksum_headers():
+    """Load the validators and body of the last remote checksum response."""
+    try:
+        with open(CHECKSUM_HEADERS_FILENAME, "r") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cached if isinstance(cached, dict) else {}
+
 
-# In case of "[SSL: CERTIFICATE_VERIFY_FAILED] certificate verify error please uncomment the following line
-# see https://support.sectigo.com/articles/Knowledge/Sectigo-AddTrust-External-CA-Root-Expiring-May-30-2020
-ssl._create_default_https_context = ssl._create_unverified_context
+def save_checksum_headers(headers, md5sum):
+    """Persist the ETag/Last-Modified of a checksum response for the next conditional GET."""
+    cached = {
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "md5": md5sum,
+    }
+    if cached["etag"] is None and cached["last_modified"] is None:
+        return  # nothing to revalidate against
+
+    tmp_filename = f"{CHECKSUM_HEADERS_FILENAME}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_filename, "w") as f:
+            json.dump(cached, f)
+        os.replace(tmp_filename, CHECKSUM_HEADERS_FILENAME)
+    except OSError:
+        try:
+            os.remove(tmp_filename)
+        except OSError:
+            pass
 
 
 def get_remote_checksum():
     """Fetch the checksum of the remote file."""
     url = f"{REMOTE_URL}/{UPLOAD_CHECKSUM_FILENAME}"
+    cached = load_checksum_headers()
+    request_headers = {}
+    if cached.get("md5"):
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
     try:
-        response = urllib.request.urlopen(url)
+        try:
+            response = open_url(url, request_headers)
+        except urllib.error.HTTPError as err:
+            if err.code == 304:
+                return cached["md5"]  # remote checksum unchanged since the last run
+            raise
         if response.status != 200:
             print(f"Error: Could not find the remote version at {url}")
             sys.exit(1)
         md5sum = response.read().decode('utf-8')
+        save_checksum_headers(response.headers, md5sum)
         return md5sum
     except Exception as err:
         print(f"Error: There was a problem connecting to {url}")
-        print("If you encounter an [SSL: CERTIFICATE_VERIFY_FAILED] error, please uncomment the following line:")
-        print("# ssl._create_default_https_context = ssl._create_unverified_context")
+        print("If you encounter an [SSL: CERTIFICATE_VERIFY_FAILED] error, please install the certifi package")
+        print("(pip install certifi) or point SSL_CERT_FILE at a CA bundle containing the Sectigo roots.")
         print(
             "For more information, see https://support.sectigo.com/articles/Knowledge/Sectigo-AddTrust-External-CA-Root-Expiring-May-30-2020")
         print(f"Technical details: {err}")
@@ -36,57 +164,174 @@ def get_remote_checksum():
 
 def get_current_checksum():
     """Calculate the checksum of the current file."""
-    hash_md5 = hashlib.md5()
     try:
         with open(UPLOADER_FILENAME, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, "md5").hexdigest()
+            try:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return hashlib.md5(mm).hexdigest()
+            except ValueError:
+                return hashlib.md5().hexdigest()  # an empty file cannot be mapped
     except FileNotFoundError:
         return ""  # return empty checksum if no file found
 
 
+def cached_local_md5():
+    """Return the checksum of the current file, reusing the last result if the file is unchanged."""
+    try:
+        st = os.stat(UPLOADER_FILENAME)
+    except FileNotFoundError:
+        return ""  # return empty checksum if no file found
+
+    try:
+        with open(LOCAL_CHECKSUM_FILENAME, "r") as f:
+            cached = json.load(f)
+        if cached["mtime_ns"] == st.st_mtime_ns and cached["size"] == st.st_size:
+            return cached["md5"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # missing or unreadable sidecar, fall back to hashing
+
+    md5sum = get_current_checksum()
+    if md5sum == "":
+        return md5sum
+
+    tmp_filename = f"{LOCAL_CHECKSUM_FILENAME}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_filename, "w") as f:
+            json.dump({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "md5": md5sum}, f)
+        os.replace(tmp_filename, LOCAL_CHECKSUM_FILENAME)
+    except OSError:
+        try:
+            os.remove(tmp_filename)
+        except OSError:
+            pass
+    return md5sum
+
+
 def download_latest_uploader():
     """Download the latest version of the uploader."""
     update_url = f"{REMOTE_URL}/{UPLOADER_FILENAME}"
-    response = urllib.request.urlopen(update_url)
-    with open(UPLOADER_FILENAME, 'wb') as f:
-        f.write(response.read())
+    # Download next to the JAR and swap it in atomically, so wrappers running
+    # concurrently (e.g. validate.py) never launch a half-written file.
+    tmp_filename = f"{UPLOADER_FILENAME}.{os.getpid()}.tmp"
+    try:
+        with open_url(update_url) as response, open(tmp_filename, 'wb') as f:
+            shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+        os.replace(tmp_filename, UPLOADER_FILENAME)
+    except BaseException:
+        try:
+            os.remove(tmp_filename)
+        except OSError:
+            pass
+        raise
 
 
 def build_command(args: list):
     """Build the command to run the uploader."""
-    command = ['java']
-    java_opts = [arg for arg in args if arg.startswith("-D")]
-    other_args = [arg for arg in args if not arg.startswith("-D") and arg != sys.argv[0]]
-    command += java_opts + ['-jar', UPLOADER_FILENAME] + other_args
-    return command
+    script = sys.argv[0]
+    java_opts = []
+    other_args = []
+    for arg in args:
+        if arg.startswith("-D"):
+            java_opts.append(arg)
+        elif arg != script:
+            other_args.append(arg)
+    return ['java', *java_opts, '-jar', UPLOADER_FILENAME, *other_args]
 
 
-def main():
-    """Main function to run the script."""
+def get_update_interval():
+    """Return the minimum number of seconds between two update checks."""
+    try:
+        return float(os.environ.get("SG_UPDATE_INTERVAL", DEFAULT_UPDATE_INTERVAL))
+    except ValueError:
+        return DEFAULT_UPDATE_INTERVAL
+
+
+def checked_recently():
+    """Check whether the last successful update check is within the update interval."""
+    if not os.path.exists(UPLOADER_FILENAME):
+        return False  # nothing to run yet, always check
+    try:
+        elapsed = time.time() - os.stat(LAST_CHECKED_FILENAME).st_mtime
+    except OSError:
+        return False
+    return 0 <= elapsed < get_update_interval()
+
+
+def mark_checked():
+    """Record a successful update check."""
+    try:
+        with open(LAST_CHECKED_FILENAME, "a"):
+            pass
+        os.utime(LAST_CHECKED_FILENAME)
+    except OSError:
+        pass
+
+
+@contextlib.contextmanager
+def update_lock():
+    """Hold an exclusive lock so wrappers sharing the JAR check and download it one at a time."""
+    lock_file = None
+    if fcntl is not None:
+        try:
+            lock_file = open(UPDATE_LOCK_FILENAME, "a")
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        except OSError:
+            pass  # locking is best effort; the download itself is still atomic
+    try:
+        yield
+    finally:
+        if lock_file is not None:
+            lock_file.close()
+
+
+def update_uploader():
+    """Download the latest uploader if its checksum differs from the local copy."""
     remote_checksum = get_remote_checksum()
 
     if remote_checksum == "":
         print("WARN. No new version found. Using previous one!")
+        return
+
+    current_checksum = cached_local_md5()
+    if current_checksum == "":
+        print(f"Downloading latest uploader version. Checksum: {remote_checksum}.")
+        download_latest_uploader()
     else:
-        current_checksum = get_current_checksum()
-        if current_checksum == "":
-            print(f"Downloading latest uploader version. Checksum: {remote_checksum}.")
+        remote_checksum = remote_checksum.strip()
+        current_checksum = current_checksum.strip()
+        if remote_checksum != current_checksum:
+            print(f"Current checksum: {current_checksum}")
+            print(f"Remote checksum: {remote_checksum}")
             download_latest_uploader()
+            print(f"Updated to version {remote_checksum}.")
+        else:
+            print(f"Script is up-to-date (checksum {remote_checksum})")
+    mark_checked()
+
+
+def main():
+    """Main function to run the script."""
+    # Wrappers started together (e.g. by validate.py) wait here and then reuse
+    # the first one's result instead of each downloading the JAR.
+    with update_lock():
+        if checked_recently():
+            print("Skipping update check, the uploader was checked recently.")
         else:
-            remote_checksum = remote_checksum.strip()
-            current_checksum = current_checksum.strip()
-            if remote_checksum != current_checksum:
-                print(f"Current checksum: {current_checksum}")
-                print(f"Remote checksum: {remote_checksum}")
-                download_latest_uploader()
-                print(f"Updated to version {remote_checksum}.")
-            else:
-                print(f"Script is up-to-date (checksum {remote_checksum})")
+            update_uploader()
 
+    close_connection()
     cmd = build_command(sys.argv)
 
+    # Replace this process with the JVM; buffered output would be lost otherwise
+    sys.stdout.flush()
+    sys.stderr.flush()
+    try:
+        os.execvp(cmd[0], cmd)
+    except OSError:
+        pass  # fall back to running the uploader as a child process
+
     # Run the command and capture the return code
     completed_process = subprocess.run(cmd)
     return_code = completed_process.returncode
@@ -2,25 +2,24 @@
 """SOPHiA CLI uploader wrapper.
 
 This script locates the run-specific SampleSheet, extracts the experiment
-details and BDS-number, and launches the SOPHiA CLI upload via ``nohup``.
+details and BDS-number, and launches the SOPHiA CLI upload detached from the
+terminal, as ``nohup`` would.
 """
 
 from __future__ import annotations
 
 import argparse
 import csv
-import subprocess
+import os
+import signal
 import sys
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Iterable, List, Tuple
 
 import logging
 from logging.handlers import SysLogHandler
 
-try:
-    import yaml
-except ModuleNotFoundError as exc:
-    raise RuntimeError("PyYAML is required to load the SOPHiA configuration.") from exc
+from config_loader import load_config
 
 CONFIG_PATH = Path(__file__).with_name("sophia_config.yaml")
 
@@ -29,23 +28,11 @@ SYSLOG_LOG_FORMAT = "%(asctime)s - PROD_MODE - %(name)s - %(levelname)s - %(mess
 SYSLOG_ADDRESS = "/dev/log"
 
 _SYSLOG_LOGGER: logging.Logger | None = None
+# Set once creating the syslog handler has failed, so it is not retried.
+_SYSLOG_UNAVAILABLE: bool = False
 
 
-def load_config(path: Path) -> Dict[str, Any]:
-    """Load YAML configuration for the SOPHiA uploader."""
-    try:
-        with path.open("r", encoding="utf-8") as config_file:
-            raw_config = yaml.safe_load(config_file) or {}
-    except FileNotFoundError as exc:
-        raise RuntimeError(f"Configuration file not found at {path}") from exc
-
-    if not isinstance(raw_config, dict):
-        raise RuntimeError("SOPHiA configuration must be a mapping")
-
-    return raw_config
-
-
-CONFIG = load_config(CONFIG_PATH)
+CONFIG = load_config(CONFIG_PATH, "SOPHiA")
 
 try:
     DEFAULT_SAMPLESHEETS_ROOT = Path(str(CONFIG["samplesheets_root"]))
@@ -79,19 +66,18 @@ def parse_args() -> argparse.Namespace:
         "--nohup-log",
         type=Path,
         default=None,
-        help="Optional path for nohup stdout/stderr (defaults to nohup.out)",
+        help="Optional path for the upload's stdout/stderr (defaults to nohup.out)",
     )
     return parser.parse_args()
 
 
 def locate_samplesheet(run_name: str, root: Path) -> Path:
-    """Return the canonical SampleSheet path for the run."""
-    candidate = root / f"{run_name}_SampleSheet.csv"
-    if not candidate.exists():
-        raise FileNotFoundError(
-            f"SampleSheet not found at expected location: {candidate}"
-        )
-    return candidate
+    """Return the canonical SampleSheet path for the run.
+
+    Existence is checked when the SampleSheet is opened by
+    ``extract_experiment_details``, avoiding a separate ``stat`` call.
+    """
+    return root / f"{run_name}_SampleSheet.csv"
 
 
 def extract_experiment_details(sample_sheet: Path) -> Tuple[str, str, str]:
@@ -99,9 +85,19 @@ def extract_experiment_details(sample_sheet: Path) -> Tuple[str, str, str]:
 
     Returns a tuple of (experiment_name, bds_identifier, raw_value).
     """
-    with sample_sheet.open("r", encoding="utf-8", newline="") as handle:
-        reader = csv.reader(handle)
-        for row in reader:
+    try:
+        handle = sample_sheet.open("r", encoding="utf-8", newline="")
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(
+            f"SampleSheet not found at expected location: {sample_sheet}"
+        ) from exc
+
+    with handle:
+        for line in handle:
+            # Cheap prefix test first; only the candidate line is parsed as CSV.
+            if not line.lstrip(' \t"').lower().startswith("experiment name"):
+                continue
+            row = next(csv.reader([line]), [])
             if row and row[0].strip().lower() == "experiment name":
                 if len(row) < 2 or not row[1].strip():
                     break
@@ -146,39 +142,68 @@ def build_upload_command(run_folder: Path, experiment_name: str) -> List[str]:
     ]
 
 
-def launch_nohup(command: List[str], log_path: Path | None, cwd: Path) -> subprocess.Popen:
-    nohup_command = ["nohup", *command]
-
-    stdout_handle = None
-    stdout_target = None
+def launch_nohup(command: List[str], log_path: Path | None, cwd: Path) -> int:
+    """Start ``command`` in a new session, immune to hangups, and return its PID.
 
+    stdin is redirected from ``/dev/null`` and stdout/stderr are appended to
+    ``log_path`` (or inherited when it is None). Failures to start the command
+    are raised in the caller, as with ``subprocess.Popen``.
+    """
+    log_fd = None
     if log_path is not None:
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        stdout_handle = log_path.open("ab")
-        stdout_target = stdout_handle
+        log_fd = os.open(log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o666)
 
+    # The write end is close-on-exec, so EOF on the read end means exec succeeded.
+    error_read, error_write = os.pipe()
+    sys.stdout.flush()
+    sys.stderr.flush()
     try:
-        process = subprocess.Popen(
-            nohup_command,
-            cwd=cwd,
-            stdout=stdout_target,
-            stderr=subprocess.STDOUT,
-        )
-    except Exception:
-        if stdout_handle is not None:
-            stdout_handle.close()
+        pid = os.fork()
+    except BaseException:
+        for fd in (error_read, error_write, log_fd):
+            if fd is not None:
+                os.close(fd)
         raise
 
-    if stdout_handle is not None:
-        stdout_handle.close()
-    return process
+    if pid == 0:
+        try:
+            os.close(error_read)
+            os.setsid()
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            os.chdir(cwd)
+            devnull_fd = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull_fd, 0)
+            if log_fd is not None:
+                os.dup2(log_fd, 1)
+            os.dup2(1, 2)
+            os.execvp(command[0], command)
+        except BaseException as exc:
+            try:
+                os.write(error_write, f"{command[0]}: {exc}".encode("utf-8", "replace"))
+            except BaseException:
+                pass
+        finally:
+            os._exit(127)
+
+    os.close(error_write)
+    if log_fd is not None:
+        os.close(log_fd)
+    with os.fdopen(error_read, "rb") as error_pipe:
+        child_error = error_pipe.read()
+    if child_error:
+        os.waitpid(pid, 0)
+        raise OSError(f"Could not start upload command: {child_error.decode('utf-8', 'replace')}")
+    return pid
 
 
 def get_syslog_logger() -> logging.Logger | None:
     """Return a configured logger that emits to syslog, caching the instance."""
-    global _SYSLOG_LOGGER
+    global _SYSLOG_LOGGER, _SYSLOG_UNAVAILABLE
     if _SYSLOG_LOGGER is not None:
         return _SYSLOG_LOGGER
+    if _SYSLOG_UNAVAILABLE:
+        return None
 
     logger = logging.getLogger(SYSLOG_LOGGER_NAME)
     logger.setLevel(logging.INFO)
@@ -188,6 +213,7 @@ def get_syslog_logger() -> logging.Logger | None:
         try:
             handler = SysLogHandler(address=SYSLOG_ADDRESS)
         except OSError:
+            _SYSLOG_UNAVAILABLE = True
             return None
         handler.setFormatter(logging.Formatter(SYSLOG_LOG_FORMAT))
         logger.addHandler(handler)
@@ -198,6 +224,8 @@ def get_syslog_logger() -> logging.Logger | None:
 
 def log_error(message: str) -> None:
     """Log an error message to syslog, ignoring logging issues."""
+    if _SYSLOG_UNAVAILABLE:
+        return
     try:
         logger = get_syslog_logger()
         if logger is None:
@@ -248,17 +276,20 @@ def main() -> None:
     nohup_log = args.nohup_log
     if nohup_log is not None:
         nohup_log = nohup_log.expanduser().resolve()
+    elif sys.stdout.isatty():
+        # Same default as nohup: don't leave a detached process writing to the terminal.
+        nohup_log = run_folder / "nohup.out"
 
     try:
-        process = launch_nohup(upload_command, nohup_log, cwd=run_folder)
+        pid = launch_nohup(upload_command, nohup_log, cwd=run_folder)
     except Exception as exc:
         log_error(f"Failed to launch upload: {exc}")
         print(f"Failed to launch upload: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    print(f"Upload started under nohup (PID {process.pid}).")
+    print(f"Upload started in the background (PID {pid}).")
     if nohup_log is None:
-        print("Output will be written to 'nohup.out' in the working directory.")
+        print("Output will be written to this script's standard output.")
     else:
         print(f"Output redirected to {nohup_log}")
 
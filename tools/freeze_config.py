@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Freeze the YAML configuration files into importable Python modules.
+
+Each ``<name>.yaml`` is written out as ``<name>_data.py`` next to it, holding
+the parsed mapping as a ``CONFIG`` literal together with the size and mtime of
+the YAML it was generated from. ``sophia.py`` and ``validate.py`` import the
+frozen module (served from its precompiled ``.pyc``) while it still matches
+the YAML, and fall back to parsing the YAML otherwise.
+
+Run this at install time and again after editing a configuration file.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import os
+import pprint
+import sys
+from pathlib import Path
+from typing import List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO_ROOT))
+
+from config_loader import frozen_module_path, parse_yaml  # noqa: E402
+
+DEFAULT_CONFIG_PATHS = [
+    REPO_ROOT / "sophia_config.yaml",
+    REPO_ROOT / "validation_config.yaml",
+]
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate <name>_data.py modules from YAML configuration files."
+    )
+    parser.add_argument(
+        "config_paths",
+        nargs="*",
+        type=Path,
+        default=DEFAULT_CONFIG_PATHS,
+        help="YAML files to freeze (defaults to the repository configuration files)",
+    )
+    return parser.parse_args()
+
+
+def freeze_config(config_path: Path) -> Path:
+    """Write the frozen module for ``config_path`` and return its path."""
+    source_stat = config_path.stat()
+    config = parse_yaml(config_path, config_path.name)
+
+    config_literal = pprint.pformat(config, sort_dicts=False)
+    try:
+        round_tripped = ast.literal_eval(config_literal)
+    except ValueError as exc:
+        raise ValueError(
+            f"{config_path} contains values that cannot be written as a Python literal"
+        ) from exc
+    if round_tripped != config:
+        raise ValueError(f"{config_path} does not round-trip through a Python literal")
+
+    target = frozen_module_path(config_path)
+    content = (
+        f'"""Generated from {config_path.name} by tools/freeze_config.py; do not edit."""\n'
+        "\n"
+        f"SOURCE_MTIME_NS = {source_stat.st_mtime_ns}\n"
+        f"SOURCE_SIZE = {source_stat.st_size}\n"
+        "\n"
+        f"CONFIG = {config_literal}\n"
+    )
+
+    tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(content, encoding="utf-8")
+        os.replace(tmp_path, target)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+    return target
+
+
+def main() -> None:
+    args = parse_args()
+    failed: List[Path] = []
+    for config_path in args.config_paths:
+        try:
+            target = freeze_config(config_path)
+        except Exception as exc:  # noqa: BLE001 - report every file, then fail.
+            print(f"Failed to freeze {config_path}: {exc}", file=sys.stderr)
+            failed.append(config_path)
+            continue
+        print(f"Froze {config_path} -> {target}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,37 +12,22 @@ changes that may impact automated processing.
 from __future__ import annotations
 
 import logging
+import os
 import subprocess
 import sys
 import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import List, Optional, Tuple
 
 from logging.handlers import SysLogHandler
 
-try:
-    import yaml
-except ModuleNotFoundError as exc:
-    raise RuntimeError("PyYAML is required to load the validation configuration.") from exc
+from config_loader import load_config
 
 CONFIG_PATH = Path(__file__).with_name("validation_config.yaml")
 
 
-def load_config(path: Path) -> Dict[str, Any]:
-    """Load YAML configuration for validation checks."""
-    try:
-        with path.open("r", encoding="utf-8") as config_file:
-            raw_config = yaml.safe_load(config_file) or {}
-    except FileNotFoundError as exc:
-        raise RuntimeError(f"Configuration file not found at {path}") from exc
-
-    if not isinstance(raw_config, dict):
-        raise RuntimeError("Validation configuration must be a mapping")
-
-    return raw_config
-
-
-CONFIG = load_config(CONFIG_PATH)
+CONFIG = load_config(CONFIG_PATH, "validation")
 
 try:
     EXPECTED_LOGIN_IAM_MESSAGE = CONFIG["expected_login_iam_message"]
@@ -57,30 +42,45 @@ except KeyError as exc:
 if not isinstance(FASTQ_TESTS, list):
     raise RuntimeError("'fastq_tests' configuration must be a list")
 
+# CLI output is searched as raw bytes; it is only decoded for error messages.
+_EXPECTED_LOGIN_IAM_NEEDLE = str(EXPECTED_LOGIN_IAM_MESSAGE).encode("utf-8")
+_EXPECTED_PIPELINE_ID_NEEDLE = EXPECTED_PIPELINE_ID.encode("utf-8")
+
 SYSLOG_LOGGER_NAME = "automated_scripts.sophia_cli.validate"
 SYSLOG_LOG_FORMAT = "%(asctime)s - PROD_MODE - %(name)s - %(levelname)s - %(message)s"
 SYSLOG_ADDRESS = "/dev/log"
 
 _SYSLOG_LOGGER: Optional[logging.Logger] = None
+# Set once creating the syslog handler has failed, so it is not retried.
+_SYSLOG_UNAVAILABLE: bool = False
+
+# Status lines look like "<number>: <status>"
+_RUN_LINE_RE = re.compile(rb"\s*\d+:\s+\S+")
 
 
-def run_command(command: List[str]) -> Tuple[int, str]:
-    """Run a command and return its exit code with combined output."""
+def run_command(command: List[str]) -> Tuple[int, bytes]:
+    """Run a command and return its exit code with combined, undecoded output."""
     result = subprocess.run(
         command,
-        capture_output=True,
-        text=True,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
         check=False,
     )
-    combined_output = "".join(filter(None, [result.stdout, result.stderr]))
-    return result.returncode, combined_output
+    return result.returncode, result.stdout
+
+
+def decode_output(output: bytes) -> str:
+    """Decode captured CLI output for inclusion in an error message."""
+    return output.decode("utf-8", errors="replace")
 
 
 def get_syslog_logger() -> Optional[logging.Logger]:
     """Create (once) and return a configured logger that writes to syslog."""
-    global _SYSLOG_LOGGER
+    global _SYSLOG_LOGGER, _SYSLOG_UNAVAILABLE
     if _SYSLOG_LOGGER is not None:
         return _SYSLOG_LOGGER
+    if _SYSLOG_UNAVAILABLE:
+        return None
 
     logger = logging.getLogger(SYSLOG_LOGGER_NAME)
     logger.setLevel(logging.INFO)
@@ -90,6 +90,7 @@ def get_syslog_logger() -> Optional[logging.Logger]:
         try:
             handler = SysLogHandler(address=SYSLOG_ADDRESS)
         except OSError:
+            _SYSLOG_UNAVAILABLE = True
             return None
         handler.setFormatter(logging.Formatter(SYSLOG_LOG_FORMAT))
         logger.addHandler(handler)
@@ -100,6 +101,8 @@ def get_syslog_logger() -> Optional[logging.Logger]:
 
 def log_validation_failure(exc: Exception) -> None:
     """Send validation failure details to syslog without impacting exit flow."""
+    if _SYSLOG_UNAVAILABLE:
+        return
     try:
         logger = get_syslog_logger()
         if logger is None:
@@ -116,13 +119,13 @@ def validate_login_iam() -> None:
     exit_code, output = run_command(command)
     if exit_code != 0:
         raise RuntimeError(
-            f"'{' '.join(command)}' exited with {exit_code}. Output:\n{output}"
+            f"'{' '.join(command)}' exited with {exit_code}. Output:\n{decode_output(output)}"
         )
-    if EXPECTED_LOGIN_IAM_MESSAGE not in output:
+    if _EXPECTED_LOGIN_IAM_NEEDLE not in output:
         raise RuntimeError(
             "Expected IAM login message not found in output.\n"
             f"Searched for: {EXPECTED_LOGIN_IAM_MESSAGE!r}\n"
-            f"Actual output:\n{output}"
+            f"Actual output:\n{decode_output(output)}"
         )
 
 
@@ -132,21 +135,16 @@ def validate_recent_runs_listed() -> None:
     exit_code, output = run_command(command)
     if exit_code != 0:
         raise RuntimeError(
-            f"'{' '.join(command)}' exited with {exit_code}. Output:\n{output}"
+            f"'{' '.join(command)}' exited with {exit_code}. Output:\n{decode_output(output)}"
         )
 
-    # Match lines that look like "<number>: <status>"
-    run_lines = [
-        line
-        for line in output.splitlines()
-        if re.match(r"^\s*\d+:\s+\S+", line)
-    ]
+    run_count = sum(1 for line in output.splitlines() if _RUN_LINE_RE.match(line))
 
-    if len(run_lines) < RECENT_RUNS_TO_CHECK:
+    if run_count < RECENT_RUNS_TO_CHECK:
         raise RuntimeError(
             "Unexpected status output.\n"
-            f"Expected at least {RECENT_RUNS_TO_CHECK} runs but found {len(run_lines)}.\n"
-            f"Captured lines:\n{output}"
+            f"Expected at least {RECENT_RUNS_TO_CHECK} runs but found {run_count}.\n"
+            f"Captured lines:\n{decode_output(output)}"
         )
 
 
@@ -154,6 +152,7 @@ def validate_fastq_errors() -> None:
     """
     Run CLI tests to ensure proper error handling for empty or single FASTQ folders.
     """
+    cases: List[Tuple[str, List[str], str]] = []
     for index, test_case in enumerate(FASTQ_TESTS, start=1):
         if not isinstance(test_case, dict):
             raise RuntimeError(
@@ -180,17 +179,27 @@ def validate_fastq_errors() -> None:
             "--pipeline",
             EXPECTED_PIPELINE_ID,
         ]
-        exit_code, output = run_command(command)
-        if expected_error not in output:
+        cases.append((label, command, str(expected_error)))
+
+    if not cases:
+        return
+
+    # Every case starts its own JVM, so launch them together and check in order.
+    with ThreadPoolExecutor(max_workers=min(len(cases), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(run_command, command) for _, command, _ in cases]
+
+    for (label, _, expected_error), future in zip(cases, futures):
+        exit_code, output = future.result()
+        if expected_error.encode("utf-8") not in output:
             raise RuntimeError(
                 f"Expected error for {label} not found.\n"
                 f"Searched for: {expected_error!r}\n"
-                f"Actual output:\n{output}"
+                f"Actual output:\n{decode_output(output)}"
             )
         if exit_code == 0:
             raise RuntimeError(
                 f"CLI did not return an error exit code for {label} case.\n"
-                f"Output:\n{output}"
+                f"Output:\n{decode_output(output)}"
             )
 
 
@@ -200,25 +209,34 @@ def validate_pipeline_available() -> None:
     exit_code, output = run_command(command)
     if exit_code != 0:
         raise RuntimeError(
-            f"'{' '.join(command)}' exited with {exit_code}. Output:\n{output}"
+            f"'{' '.join(command)}' exited with {exit_code}. Output:\n{decode_output(output)}"
         )
 
-    if EXPECTED_PIPELINE_ID not in output:
+    if _EXPECTED_PIPELINE_ID_NEEDLE not in output:
         raise RuntimeError(
             f"Expected pipeline ID {EXPECTED_PIPELINE_ID} not found in pipeline list.\n"
-            f"Actual output:\n{output}"
+            f"Actual output:\n{decode_output(output)}"
         )
 
 
+VALIDATIONS = (
+    validate_login_iam,
+    validate_recent_runs_listed,
+    validate_pipeline_available,
+    validate_fastq_errors,
+)
+
+
 def main() -> None:
-    try:
-        validate_login_iam()
-        validate_recent_runs_listed()
-        validate_pipeline_available()
-        validate_fastq_errors()
-    except Exception as exc:  # noqa: BLE001 - need to surface the root cause.
-        log_validation_failure(exc)
-        print(f"Validation failed: {exc}")
+    # Each check launches its own JVM through the wrapper, so run them side by side.
+    with ThreadPoolExecutor(max_workers=len(VALIDATIONS)) as executor:
+        futures = [executor.submit(validation) for validation in VALIDATIONS]
+
+    failures = [exc for exc in (future.exception() for future in futures) if exc is not None]
+    if failures:
+        for exc in failures:
+            log_validation_failure(exc)
+            print(f"Validation failed: {exc}")
         sys.exit(1)
     print(
         f"Validation passed: IAM login confirmed, {RECENT_RUNS_TO_CHECK} runs listed, "